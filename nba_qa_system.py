@@ -11,12 +11,25 @@ This module implements a RAG-like system that:
 Author: Generated for NBA Chat Assistant
 """
 
+import copy
+import os
 import re
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-
-from transformers import pipeline
+import sys
+import functools
+import hashlib
+import importlib.util
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass, replace
+
+import ahocorasick
+from cachetools import LRUCache, TTLCache
+import numpy as np
+import pandas as pd
 from nba_api.stats.endpoints import (
     playercareerstats,
     playergamelog,
@@ -32,9 +45,257 @@ from nba_api.stats.static import teams, players
 from nba_api.stats.library.parameters import Season, SeasonType
 
 
-@dataclass
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character (\\w)"""
+    return char.isalnum() or char == "_"
+
+
+def _keyword_union_re(keywords) -> re.Pattern:
+    """
+    Compile one alternation matching any of the keywords as a substring.
+    The zero-width lookahead lets findall() report overlapping hits (e.g.
+    both "this season" and "season"); longer keywords are tried first.
+    """
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(set(keywords), key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+def _build_automaton(entries) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton from (word, kind, data) entries.
+    Each word maps to (word length, list of (kind, data)) so one word can
+    stand for several entities (e.g. a shared last name).
+    """
+    payloads = {}
+    for word, kind, data in entries:
+        if word:
+            payloads.setdefault(word, []).append((kind, data))
+
+    automaton = ahocorasick.Automaton()
+    for word, hits in payloads.items():
+        automaton.add_word(word, (len(word), hits))
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_word_matches(automaton: ahocorasick.Automaton, text: str):
+    """Yield (start, kind, data) for automaton hits that are standalone words"""
+    last_idx = len(text) - 1
+    for end_idx, (length, hits) in automaton.iter(text):
+        start_idx = end_idx - length + 1
+        # Skip hits that are part of a longer word
+        if start_idx > 0 and _is_word_char(text[start_idx - 1]):
+            continue
+        if end_idx < last_idx and _is_word_char(text[end_idx + 1]):
+            continue
+        for kind, data in hits:
+            yield start_idx, kind, data
+
+
+@functools.lru_cache(maxsize=1)
+def _team_index() -> Tuple[List[Dict], Dict, Dict, Dict]:
+    """
+    Static NBA teams, loaded once per process: (teams, by lowercase full
+    name, by lowercase abbreviation, by id)
+    """
+    teams_list = teams.get_teams()
+    return (
+        teams_list,
+        {team["full_name"].lower(): team for team in teams_list},
+        {team["abbreviation"].lower(): team for team in teams_list},
+        {team["id"]: team for team in teams_list},
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _player_index() -> Tuple[List[Dict], Dict[str, Dict]]:
+    """Static NBA players, loaded once per process: (players, by lowercase full name)"""
+    players_list = players.get_players()
+    return players_list, {
+        player["full_name"].lower(): player for player in players_list
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _player_automaton() -> ahocorasick.Automaton:
+    """Full/first/last-name matcher over all players, built once per process"""
+    _, player_names = _player_index()
+    return _build_automaton(
+        entry
+        for player_data in player_names.values()
+        for entry in (
+            (player_data["full_name"].lower(), "full", player_data),
+            (player_data["first_name"].lower(), "first", player_data),
+            (player_data["last_name"].lower(), "last", player_data),
+        )
+    )
+
+
+# Distilled extractive QA model (66M params vs ~110M+ for BERT/RoBERTa-base)
+DEFAULT_QA_MODEL = "distilbert-base-cased-distilled-squad"
+
+# QA inference backends: plain FP32 PyTorch, or ONNX Runtime with INT8 weights
+QA_BACKENDS = ("torch", "onnx-int8")
+
+# Context windows per QA model forward pass
+QA_BATCH_SIZE = 8
+
+# Where exported + quantized ONNX models are stored between runs
+QUANTIZED_MODEL_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "nba_qa_system", "onnx-int8"
+)
+
+
+def _model_revision(model_name: str) -> str:
+    """
+    Identify the exact weights behind model_name: a local directory by its
+    absolute path plus newest file mtime (changes when it is fine-tuned
+    again), a hub model by its commit sha (falling back to the locally
+    cached snapshot when offline)
+    """
+    if os.path.isdir(model_name):
+        model_dir = os.path.abspath(model_name)
+        newest = max(
+            (
+                entry.stat().st_mtime_ns
+                for entry in os.scandir(model_dir)
+                if entry.is_file()
+            ),
+            default=0,
+        )
+        return f"{model_dir}@{newest}"
+
+    from huggingface_hub import model_info, try_to_load_from_cache
+
+    try:
+        return f"{model_name}@{model_info(model_name).sha}"
+    except Exception:
+        # Offline: snapshots live under .../snapshots/<sha>/
+        cached_config = try_to_load_from_cache(model_name, "config.json")
+        if not isinstance(cached_config, str):
+            raise
+        return f"{model_name}@{os.path.basename(os.path.dirname(cached_config))}"
+
+
+def _load_quantized_qa_model(model_name: str):
+    """
+    Export model_name to ONNX and apply dynamic INT8 quantization (once per
+    model revision; the result is reused from QUANTIZED_MODEL_DIR). Requires
+    optimum[onnxruntime].
+    ONNX Runtime's INT8 kernels are what give the CPU speedup (VNNI dot
+    products); torch.quantization.quantize_dynamic often does not.
+    """
+    from optimum.onnxruntime import ORTModelForQuestionAnswering, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    # One export per exact weights, so retrained or updated models (and same
+    # relative paths in different checkouts) never reuse a stale artifact
+    revision_key = hashlib.sha1(_model_revision(model_name).encode()).hexdigest()
+    save_dir = os.path.join(
+        QUANTIZED_MODEL_DIR,
+        f"{os.path.basename(os.path.normpath(model_name))}-{revision_key[:16]}",
+    )
+    quantized_file = "model_quantized.onnx"
+
+    if not os.path.exists(os.path.join(save_dir, quantized_file)):
+        model = ORTModelForQuestionAnswering.from_pretrained(model_name, export=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=save_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=False
+            ),
+        )
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(save_dir)
+
+    model = ORTModelForQuestionAnswering.from_pretrained(
+        save_dir, file_name=quantized_file
+    )
+    tokenizer = AutoTokenizer.from_pretrained(save_dir)
+    return model, tokenizer
+
+
+def _cuda_device() -> int:
+    """First CUDA device index when a GPU is usable, else -1 (CPU)"""
+    try:
+        import torch
+    except ImportError:
+        return -1
+    return 0 if torch.cuda.is_available() else -1
+
+
+def _resolve_qa_backend(backend: str, device: int) -> str:
+    """
+    Map "auto" to torch on GPU, otherwise to the INT8 ONNX backend when
+    optimum[onnxruntime] is installed (falling back to FP32 torch); other
+    values pass through
+    """
+    if backend != "auto":
+        return backend
+    if device >= 0:
+        return "torch"
+    if importlib.util.find_spec("optimum") and importlib.util.find_spec("onnxruntime"):
+        return "onnx-int8"
+    return "torch"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_qa_pipeline(
+    model_name: str = DEFAULT_QA_MODEL,
+    device: int = -1,
+    backend: str = "torch",
+    num_threads: Optional[int] = None,
+):
+    """
+    Load a question-answering pipeline once per (model, device, backend) and
+    share it across NBAQASystem instances instead of reloading weights.
+    num_threads, when given, caps torch's CPU threads (process-wide).
+    """
+    if backend not in QA_BACKENDS:
+        raise ValueError(
+            f"Unknown QA backend {backend!r}, expected one of {QA_BACKENDS}"
+        )
+
+    # Imported here so the ~seconds-long transformers import is only paid
+    # once a QA model is actually needed
+    from transformers import pipeline
+
+    if backend == "onnx-int8":
+        # ONNX Runtime runs on CPU; same pipeline interface for call sites
+        model, tokenizer = _load_quantized_qa_model(model_name)
+        return pipeline("question-answering", model=model, tokenizer=tokenizer)
+
+    import torch  # Already imported by transformers; only needed here
+
+    if num_threads is not None and device < 0:
+        # Opt-in: torch's thread count is global to the process
+        torch.set_num_threads(num_threads)
+    qa_pipeline = pipeline(
+        "question-answering",
+        model=model_name,
+        device=device,
+        # FP16 halves memory traffic on GPU and runs on tensor cores
+        torch_dtype=torch.float16 if device >= 0 else torch.float32,
+    )
+    qa_pipeline.model.eval()
+    return qa_pipeline
+
+
+# __slots__ for the result dataclasses where supported (dataclass slots=True
+# needs Python 3.10+; older interpreters keep a per-instance __dict__)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class QuestionAnalysis:
-    """Structured analysis of a user question"""
+    """
+    Structured analysis of a user question. Frozen, and QuestionAnalyzer
+    hands every caller its own copy of entities, so cached analyses stay
+    intact whatever callers do with the result
+    """
 
     question: str
     question_type: (
@@ -42,16 +303,23 @@ class QuestionAnalysis:
     )
     entities: Dict[str, Any]  # Extracted entities (players, teams, dates, stats)
     confidence: float
+    # Lowercased question for keyword checks downstream (None: lowercase
+    # question on demand)
+    question_lower: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class QAAnswer:
-    """Structured answer from QA system"""
+    """
+    Structured answer from QA system. Frozen at the top level only: source
+    dicts and raw_data are mutable, so NBAQASystem hands every caller its own
+    copy of cached answers
+    """
 
     answer: str
     confidence: float
     context_used: str
-    sources: List[Dict[str, str]]  # API endpoints, game IDs, dates
+    sources: Tuple[Dict[str, str], ...]  # API endpoints, game IDs, dates
     raw_data: Optional[Dict] = None
 
 
@@ -99,31 +367,187 @@ class QuestionAnalyzer:
         "season": ["season", "year"],
     }
 
-    def __init__(self):
-        self.nba_teams = teams.get_teams()
-        self.nba_players = players.get_players()
-        self.team_names = {team["full_name"].lower(): team for team in self.nba_teams}
-        self.team_abbrevs = {
-            team["abbreviation"].lower(): team for team in self.nba_teams
-        }
-        self.player_names = {
-            player["full_name"].lower(): player for player in self.nba_players
+    # League leader/record keywords
+    LEADER_KEYWORDS = [
+        "top",
+        "most",
+        "best",
+        "leader",
+        "leaders",
+        "record",
+        "records",
+        "history",
+        "all time",
+        "all-time",
+        "league",
+    ]
+
+    # One regex pass per category instead of a substring scan per keyword
+    KEYWORD_TO_STAT = {
+        keyword: stat
+        for stat, keywords in STAT_KEYWORDS.items()
+        for keyword in keywords
+    }
+    KEYWORD_TO_TEMPORAL = {
+        keyword: key
+        for key, keywords in TEMPORAL_KEYWORDS.items()
+        for keyword in keywords
+    }
+    STAT_RE = _keyword_union_re(KEYWORD_TO_STAT)
+    TEMPORAL_RE = _keyword_union_re(KEYWORD_TO_TEMPORAL)
+    LEADER_RE = _keyword_union_re(LEADER_KEYWORDS)
+
+    # First characters of each category's keywords: a question containing
+    # none of them can't match, so the regex pass is skipped entirely
+    STAT_TRIGGERS = frozenset(keyword[0] for keyword in KEYWORD_TO_STAT)
+    TEMPORAL_TRIGGERS = frozenset(keyword[0] for keyword in KEYWORD_TO_TEMPORAL)
+    LEADER_TRIGGERS = frozenset(keyword[0] for keyword in LEADER_KEYWORDS)
+
+    # Whole-question small talk: no NBA entities to extract
+    SMALL_TALK = frozenset(
+        {
+            "hi",
+            "hello",
+            "hey",
+            "hiya",
+            "howdy",
+            "yo",
+            "thanks",
+            "thank you",
+            "thx",
+            "ty",
+            "ok",
+            "okay",
+            "bye",
+            "goodbye",
+            "good morning",
+            "good night",
+            "yes",
+            "no",
+            "cool",
+            "great",
+            "nice",
+            "lol",
         }
+    )
+
+    # Common team name aliases (short names -> full names)
+    TEAM_ALIASES = {
+        "lakers": "los angeles lakers",
+        "celtics": "boston celtics",
+        "warriors": "golden state warriors",
+        "heat": "miami heat",
+        "spurs": "san antonio spurs",
+        "knicks": "new york knicks",
+        "bulls": "chicago bulls",
+        "mavs": "dallas mavericks",
+        "mavericks": "dallas mavericks",
+        "nets": "brooklyn nets",
+        "clippers": "los angeles clippers",
+        "suns": "phoenix suns",
+        "nuggets": "denver nuggets",
+        "bucks": "milwaukee bucks",
+        "sixers": "philadelphia 76ers",
+        "76ers": "philadelphia 76ers",
+        "raptors": "toronto raptors",
+        "wizards": "washington wizards",
+        "hawks": "atlanta hawks",
+        "hornets": "charlotte hornets",
+        "cavs": "cleveland cavaliers",
+        "cavaliers": "cleveland cavaliers",
+        "pistons": "detroit pistons",
+        "pacers": "indiana pacers",
+        "grizzlies": "memphis grizzlies",
+        "timberwolves": "minnesota timberwolves",
+        "pelicans": "new orleans pelicans",
+        "thunder": "oklahoma city thunder",
+        "magic": "orlando magic",
+        "blazers": "portland trail blazers",
+        "trail blazers": "portland trail blazers",
+        "kings": "sacramento kings",
+        "jazz": "utah jazz",
+    }
+
+    # Specific dates (simple pattern) and game IDs (format: 0022400928),
+    # found together in a single scan of the question
+    _META_RE = re.compile(
+        r"(?P<date>\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4})|(?P<game_id>00\d{8})"
+    )
+
+    # "Top N" patterns: "top 5", "top 10", "top 3", etc.
+    _TOP_N_RES = [
+        re.compile(r"top\s+(\d+)", re.IGNORECASE),
+        re.compile(r"(\d+)\s+best", re.IGNORECASE),
+        re.compile(r"(\d+)\s+most", re.IGNORECASE),
+        re.compile(r"first\s+(\d+)", re.IGNORECASE),
+    ]
+
+    def __init__(self):
+        # Shared, process-wide lookups (not rebuilt per analyzer instance)
+        self.nba_teams, self.team_names, self.team_abbrevs, _ = _team_index()
+        self.nba_players, self.player_names = _player_index()
+
+        # Single-pass matchers over the question
+        self._player_ac = _player_automaton()
+        self._team_ac = _build_automaton(
+            [
+                (alias, "alias", self.team_names[full_name])
+                for alias, full_name in self.TEAM_ALIASES.items()
+                if full_name in self.team_names
+            ]
+            + [(name, "full", team) for name, team in self.team_names.items()]
+            + [(abbrev, "abbrev", team) for abbrev, team in self.team_abbrevs.items()]
+        )
+
+        # Analysis only depends on the lowercased question; cache per instance
+        self._analyze_lower = functools.lru_cache(maxsize=2048)(self._analyze_uncached)
 
     def analyze(self, question: str) -> QuestionAnalysis:
         """Main analysis method"""
-        question_lower = question.lower()
+        analysis = self._analyze_lower(question.lower())
+        # Fresh entity containers per call (the cached analysis is shared),
+        # carrying the caller's casing of the question
+        return replace(
+            analysis,
+            question=question,
+            entities=self._copy_entities(analysis.entities),
+        )
+
+    @staticmethod
+    def _copy_entities(entities: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy entities and their list/dict values one level deep"""
+        return {
+            key: (
+                list(value)
+                if isinstance(value, list)
+                else dict(value) if isinstance(value, dict) else value
+            )
+            for key, value in entities.items()
+        }
+
+    def cache_clear(self) -> None:
+        """Drop all cached analyses (e.g. after reloading player/team data)"""
+        self._analyze_lower.cache_clear()
+
+    def _analyze_uncached(self, question_lower: str) -> QuestionAnalysis:
+        """Analyze an already-lowercased question"""
+        # Fast path: empty input / small talk skips all entity extraction
+        normalized = question_lower.strip(" \t\n?!.,")
+        if not normalized or normalized in self.SMALL_TALK:
+            return self._general_analysis(question_lower)
+
+        specific_date, game_id = self._extract_date_and_game_id(question_lower)
 
         # Extract entities
         entities = {
             "players": self._extract_players(question_lower),
             "teams": self._extract_teams(question_lower),
             "stats": self._extract_stats(question_lower),
-            "temporal": self._extract_temporal(question_lower),
+            "temporal": self._extract_temporal(question_lower, specific_date),
             "comparison": "vs" in question_lower
             or "versus" in question_lower
             or "compare" in question_lower,
-            "game_id": self._extract_game_id(question_lower),
+            "game_id": game_id,
             "top_n": self._extract_top_n(question_lower),
             "league_leader": self._is_league_leader_question(question_lower),
         }
@@ -135,10 +559,31 @@ class QuestionAnalyzer:
         confidence = self._calculate_confidence(entities)
 
         return QuestionAnalysis(
-            question=question,
+            question=question_lower,
             question_type=question_type,
             entities=entities,
             confidence=confidence,
+            question_lower=question_lower,
+        )
+
+    def _general_analysis(self, question_lower: str) -> QuestionAnalysis:
+        """Analysis with no extracted entities ("general" question)"""
+        entities = {
+            "players": [],
+            "teams": [],
+            "stats": [],
+            "temporal": {},
+            "comparison": False,
+            "game_id": None,
+            "top_n": None,
+            "league_leader": False,
+        }
+        return QuestionAnalysis(
+            question=question_lower,
+            question_type="general",
+            entities=entities,
+            confidence=0.0,
+            question_lower=question_lower,
         )
 
     def _extract_players(self, question: str) -> List[Dict]:
@@ -146,27 +591,38 @@ class QuestionAnalyzer:
         Extract player names from question (question is already lowercase).
         Prioritizes full name matches over last name matches to avoid ambiguity.
         """
-        # First pass: Check for full name matches (prioritize exact matches)
         full_name_matches = []
-        for player_name, player_data in self.player_names.items():
-            # player_name is already lowercase from initialization
-            first_name = player_data["first_name"].lower()
-            last_name = player_data["last_name"].lower()
+        first_name_hits = []
+        last_name_starts = {}
+        last_name_matches = []
+        seen_last_names = set()
 
-            # Check if full name (first + last) appears together in question
-            if player_name in question:
-                full_name_matches.append(player_data)
-            # Also check if first name and last name appear together (handles variations)
-            elif first_name in question and last_name in question:
-                # Verify they appear close together (within reasonable distance)
-                first_idx = question.find(first_name)
-                last_idx = question.find(last_name)
-                if (
-                    first_idx != -1
-                    and last_idx != -1
-                    and abs(first_idx - last_idx) < 30
-                ):
+        # One scan of the question yields every full/first/last name hit
+        for start_idx, kind, player_data in _iter_word_matches(
+            self._player_ac, question
+        ):
+            if kind == "full":
+                # Full name (first + last) appears together in question
+                if player_data not in full_name_matches:
                     full_name_matches.append(player_data)
+            elif kind == "first":
+                first_name_hits.append((start_idx, player_data))
+            else:
+                last_name_starts.setdefault(player_data["id"], []).append(start_idx)
+                # Fallback candidates: first player for each distinct last name
+                last_name = player_data["last_name"].lower()
+                if last_name not in seen_last_names:
+                    last_name_matches.append(player_data)
+                    seen_last_names.add(last_name)
+
+        # Also check if first name and last name appear together (handles variations)
+        for first_idx, player_data in first_name_hits:
+            # Verify they appear close together (within reasonable distance)
+            if player_data not in full_name_matches and any(
+                abs(first_idx - last_idx) < 30
+                for last_idx in last_name_starts.get(player_data["id"], ())
+            ):
+                full_name_matches.append(player_data)
 
         # If we found full name matches, return only those (prioritize specificity)
         if full_name_matches:
@@ -174,151 +630,76 @@ class QuestionAnalyzer:
 
         # Second pass: Fallback to last name only if no full name match found
         # This handles cases like "How many points did Curry score?" (ambiguous)
-        last_name_matches = []
-        seen_last_names = set()
-        for player_name, player_data in self.player_names.items():
-            last_name = player_data["last_name"].lower()
-            # Only check last name if it's a distinct word (not part of another word)
-            # Use word boundaries: check if last name appears as a standalone word
-            if last_name in question and last_name not in seen_last_names:
-                # Verify it's not part of a longer word using word boundaries
-                last_name_pattern = r"\b" + re.escape(last_name) + r"\b"
-                if re.search(last_name_pattern, question):
-                    last_name_matches.append(player_data)
-                    seen_last_names.add(last_name)
-
         return last_name_matches
 
     def _extract_teams(self, question: str) -> List[Dict]:
         """Extract team names from question"""
-        found_teams = []
-
-        # Common team name aliases (short names -> full names)
-        team_aliases = {
-            "lakers": "los angeles lakers",
-            "celtics": "boston celtics",
-            "warriors": "golden state warriors",
-            "heat": "miami heat",
-            "spurs": "san antonio spurs",
-            "knicks": "new york knicks",
-            "bulls": "chicago bulls",
-            "mavs": "dallas mavericks",
-            "mavericks": "dallas mavericks",
-            "nets": "brooklyn nets",
-            "clippers": "los angeles clippers",
-            "suns": "phoenix suns",
-            "nuggets": "denver nuggets",
-            "bucks": "milwaukee bucks",
-            "sixers": "philadelphia 76ers",
-            "76ers": "philadelphia 76ers",
-            "raptors": "toronto raptors",
-            "wizards": "washington wizards",
-            "hawks": "atlanta hawks",
-            "hornets": "charlotte hornets",
-            "cavs": "cleveland cavaliers",
-            "cavaliers": "cleveland cavaliers",
-            "pistons": "detroit pistons",
-            "pacers": "indiana pacers",
-            "grizzlies": "memphis grizzlies",
-            "timberwolves": "minnesota timberwolves",
-            "pelicans": "new orleans pelicans",
-            "thunder": "oklahoma city thunder",
-            "magic": "orlando magic",
-            "blazers": "portland trail blazers",
-            "trail blazers": "portland trail blazers",
-            "kings": "sacramento kings",
-            "jazz": "utah jazz",
-        }
+        matches = list(_iter_word_matches(self._team_ac, question))
 
         # First, check for common aliases (prioritize these)
-        question_lower = question.lower()
-        for alias, full_name in team_aliases.items():
-            # Use word boundaries to avoid partial matches
-            alias_pattern = r"\b" + re.escape(alias) + r"\b"
-            if re.search(alias_pattern, question_lower):
-                # Find the team by full name
-                if full_name in self.team_names:
-                    found_teams.append(self.team_names[full_name])
-                    return found_teams  # Return immediately for alias matches
-
-        # Check full names (exact match preferred)
-        for team_name, team_data in self.team_names.items():
-            # Use word boundaries for better matching
-            team_pattern = r"\b" + re.escape(team_name) + r"\b"
-            if re.search(team_pattern, question_lower):
-                found_teams.append(team_data)
+        for _, kind, team_data in matches:
+            if kind == "alias":
+                return [team_data]  # Return immediately for alias matches
 
-        # Check abbreviations
-        for abbrev, team_data in self.team_abbrevs.items():
-            abbrev_pattern = r"\b" + re.escape(abbrev) + r"\b"
-            if (
-                re.search(abbrev_pattern, question_lower)
-                and team_data not in found_teams
-            ):
+        # Then full names and abbreviations
+        found_teams = []
+        for _, _, team_data in matches:
+            if team_data not in found_teams:
                 found_teams.append(team_data)
 
         return found_teams
 
     def _extract_stats(self, question: str) -> List[str]:
         """Extract stat keywords from question"""
-        found_stats = []
-        for stat, keywords in self.STAT_KEYWORDS.items():
-            if any(keyword in question for keyword in keywords):
-                found_stats.append(stat)
-        return found_stats
-
-    def _extract_temporal(self, question: str) -> Dict[str, Any]:
-        """Extract temporal information"""
+        if self.STAT_TRIGGERS.isdisjoint(question):
+            return []
+        matched = {self.KEYWORD_TO_STAT[m] for m in self.STAT_RE.findall(question)}
+        # Keep STAT_KEYWORDS order; the first stat is treated as most relevant
+        return [stat for stat in self.STAT_KEYWORDS if stat in matched]
+
+    def _extract_temporal(
+        self, question: str, specific_date: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Extract temporal information (specific_date from the meta scan)"""
         temporal = {}
-        for key, keywords in self.TEMPORAL_KEYWORDS.items():
-            if any(keyword in question for keyword in keywords):
-                temporal[key] = True
+        if not self.TEMPORAL_TRIGGERS.isdisjoint(question):
+            matched = {
+                self.KEYWORD_TO_TEMPORAL[m] for m in self.TEMPORAL_RE.findall(question)
+            }
+            temporal = {key: True for key in self.TEMPORAL_KEYWORDS if key in matched}
 
-        # Extract specific dates (simple pattern)
-        date_pattern = r"\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}"
-        dates = re.findall(date_pattern, question)
-        if dates:
-            temporal["specific_date"] = dates[0]
+        if specific_date:
+            temporal["specific_date"] = specific_date
 
         return temporal
 
-    def _extract_game_id(self, question: str) -> Optional[str]:
-        """Extract game ID if present (format: 0022400928)"""
-        game_id_pattern = r"00\d{8}"
-        match = re.search(game_id_pattern, question)
-        return match.group(0) if match else None
+    def _extract_date_and_game_id(
+        self, question: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """First specific date and first game ID (format: 0022400928), if present"""
+        specific_date = game_id = None
+        for match in self._META_RE.finditer(question):
+            if match.lastgroup == "date":
+                specific_date = specific_date or match.group("date")
+            else:
+                game_id = game_id or match.group("game_id")
+            if specific_date and game_id:
+                break
+        return specific_date, game_id
 
     def _extract_top_n(self, question: str) -> Optional[int]:
         """Extract 'top N' number from question (e.g., 'top 5', 'top 10')"""
-        # Patterns: "top 5", "top 10", "top 3", etc.
-        patterns = [
-            r"top\s+(\d+)",
-            r"(\d+)\s+best",
-            r"(\d+)\s+most",
-            r"first\s+(\d+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
+        for pattern in self._TOP_N_RES:
+            match = pattern.search(question)
             if match:
                 return int(match.group(1))
         return None
 
     def _is_league_leader_question(self, question: str) -> bool:
         """Check if question is about league leaders/records"""
-        leader_keywords = [
-            "top",
-            "most",
-            "best",
-            "leader",
-            "leaders",
-            "record",
-            "records",
-            "history",
-            "all time",
-            "all-time",
-            "league",
-        ]
-        return any(keyword in question for keyword in leader_keywords)
+        if self.LEADER_TRIGGERS.isdisjoint(question):
+            return False
+        return self.LEADER_RE.search(question) is not None
 
     def _classify_question(self, question: str, entities: Dict) -> str:
         """Classify question type"""
@@ -355,9 +736,163 @@ class QuestionAnalyzer:
 class NBADataRetriever:
     """Retrieves data from NBA API based on question analysis"""
 
+    # Concurrent NBA API requests (calls are I/O-bound)
+    MAX_API_WORKERS = 4
+
+    # Only the columns context generation reads; avoids a dict entry per
+    # unused column per row on 400+ event play-by-play / full boxscores
+    PBP_COLUMNS = [
+        "PERIOD",
+        "PCTIMESTRING",
+        "EVENTMSGTYPE",
+        "PLAYER1_NAME",
+        "HOMEDESCRIPTION",
+        "NEUTRALDESCRIPTION",
+        "VISITORDESCRIPTION",
+        "SCORE",
+        "SCOREMARGIN",
+    ]
+    BOXSCORE_COLUMNS = [
+        "PLAYER_NAME",
+        "TEAM_ABBREVIATION",
+        "MIN",
+        "PTS",
+        "REB",
+        "AST",
+        "STL",
+        "BLK",
+        "TO",
+        "PLUS_MINUS",
+    ]
+
     def __init__(self):
-        self.cache = {}  # Simple cache for API responses
-        self.nba_teams = teams.get_teams()  # For team name lookups
+        # API responses keyed by endpoint + params; entries expire after 5 minutes
+        self.cache = TTLCache(maxsize=256, ttl=300)
+        self._cache_lock = threading.Lock()  # TTLCache is not thread-safe
+        # For team name lookups (abbreviations keyed lowercase)
+        self.nba_teams, _, self._team_by_abbrev, self._team_by_id = _team_index()
+
+    @staticmethod
+    def _record_error(data: Dict[str, Any], message: str) -> None:
+        """
+        Log a failed fetch and note it under data["errors"], so answers built
+        from missing or partial data are not cached
+        """
+        print(message)
+        data.setdefault("errors", []).append(message)
+
+    def _cached(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached response for key, calling factory on a miss. Frames
+        are handed out as copies (they end up in raw_data), so callers can't
+        alter what later calls read from the cache
+        """
+        with self._cache_lock:
+            value = self.cache.get(key)
+        if value is None:
+            value = factory()
+            with self._cache_lock:
+                self.cache[key] = value
+        return value.copy() if isinstance(value, pd.DataFrame) else value
+
+    def _fetch_career_df(self, player_id: int):
+        """PlayerCareerStats season totals for a player"""
+        return self._cached(
+            ("career", player_id),
+            lambda: playercareerstats.PlayerCareerStats(
+                player_id=player_id
+            ).get_data_frames()[0],
+        )
+
+    def _fetch_game_log_df(self, player_id: int, season: str):
+        """PlayerGameLog for a player and season"""
+        return self._cached(
+            ("game_log", player_id, season),
+            lambda: playergamelog.PlayerGameLog(
+                player_id=player_id, season=season
+            ).get_data_frames()[0],
+        )
+
+    def _fetch_games_df(
+        self,
+        team_id: Optional[int] = None,
+        player_id: Optional[int] = None,
+        season: Optional[str] = None,
+    ):
+        """LeagueGameFinder games for a team and/or player (dates parsed)"""
+        return self._cached(
+            ("games", team_id, player_id, season),
+            lambda: self._normalize_games_df(
+                leaguegamefinder.LeagueGameFinder(
+                    team_id_nullable=team_id,
+                    player_id_nullable=player_id,
+                    season_nullable=season,
+                ).get_data_frames()[0]
+            ),
+        )
+
+    @staticmethod
+    def _normalize_games_df(games_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse GAME_DATE ("YYYY-MM-DD" strings) to datetime64 once, right after
+        retrieval, so cached frames never need reparsing. An explicit format
+        skips pandas' per-row format inference; if any date doesn't match it,
+        the column is reparsed with inference instead of becoming NaT.
+        """
+        if "GAME_DATE" in games_df:
+            raw_dates = games_df["GAME_DATE"]
+            game_dates = pd.to_datetime(
+                raw_dates, format="%Y-%m-%d", cache=True, errors="coerce"
+            )
+            if (game_dates.isna() & raw_dates.notna()).any():
+                game_dates = pd.to_datetime(raw_dates, cache=True, errors="coerce")
+            games_df["GAME_DATE"] = game_dates
+        return games_df
+
+    @staticmethod
+    def _format_game_date(game_date: Any) -> str:
+        """Render a normalized GAME_DATE as YYYY-MM-DD"""
+        if pd.isna(game_date):
+            return ""
+        if hasattr(game_date, "strftime"):
+            return game_date.strftime("%Y-%m-%d")
+        return str(game_date)
+
+    def _fetch_boxscore_df(self, game_id: str):
+        """BoxScoreTraditionalV2 player stats for a game"""
+        return self._cached(
+            ("boxscore", game_id),
+            lambda: boxscoretraditionalv2.BoxScoreTraditionalV2(
+                game_id=game_id
+            ).get_data_frames()[0],
+        )
+
+    def _fetch_play_by_play_df(self, game_id: str):
+        """PlayByPlay events for a game"""
+        return self._cached(
+            ("play_by_play", game_id),
+            lambda: playbyplay.PlayByPlay(game_id=game_id).get_data_frames()[0],
+        )
+
+    def _fetch_league_leaders_df(self, stat_abbrev: str, season: str):
+        """LeagueLeaders regular-season totals for a stat category"""
+        return self._cached(
+            ("league_leaders", stat_abbrev, season),
+            lambda: leagueleaders.LeagueLeaders(
+                league_id="00",
+                season=season,
+                season_type_all_star="Regular Season",
+                stat_category_abbreviation=stat_abbrev,
+                per_mode48="Totals",
+            ).get_data_frames()[0],
+        )
+
+    @staticmethod
+    def _records(df: pd.DataFrame, columns: List[str]) -> List[Dict]:
+        """Convert just the given columns (those present) to row dicts"""
+        if df.empty:
+            return []
+        return df[[col for col in columns if col in df.columns]].to_dict("records")
 
     def _get_stat_abbreviation(self, stat_key: str) -> str:
         """Map stat keyword to NBA API abbreviation"""
@@ -397,28 +932,36 @@ class NBADataRetriever:
         """Get player statistics"""
         data = {"type": "player_stats", "players": []}
 
-        for player in entities.get("players", []):
+        # Fire career stats + recent game log requests for all players at once
+        with ThreadPoolExecutor(max_workers=self.MAX_API_WORKERS) as executor:
+            pending = [
+                (
+                    player,
+                    executor.submit(self._fetch_career_df, player["id"]),
+                    executor.submit(
+                        self._fetch_game_log_df, player["id"], Season.default
+                    ),
+                )
+                for player in entities.get("players", [])
+            ]
+
+        for player, career_future, game_log_future in pending:
             player_id = player["id"]
             player_name = player["full_name"]
 
             # Get career stats
             try:
-                career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
-                career_df = career_stats.get_data_frames()[0]
+                career_df = career_future.result()
 
                 # Get recent game log
-                game_log = playergamelog.PlayerGameLog(
-                    player_id=player_id, season=Season.default
-                )
-                game_log_df = game_log.get_data_frames()[0]
+                game_log_df = game_log_future.result()
 
                 data["players"].append(
                     {
                         "player_id": player_id,
                         "player_name": player_name,
-                        "career_stats": career_df.to_dict("records")
-                        if not career_df.empty
-                        else [],
+                        # Kept as a DataFrame so totals are one vectorized sum
+                        "career_df": career_df,
                         "game_log": game_log_df.to_dict("records")
                         if not game_log_df.empty
                         else [],
@@ -428,7 +971,7 @@ class NBADataRetriever:
                     }
                 )
             except Exception as e:
-                print(f"Error fetching stats for {player_name}: {e}")
+                self._record_error(data, f"Error fetching stats for {player_name}: {e}")
                 continue
 
         return data
@@ -441,18 +984,17 @@ class NBADataRetriever:
         if game_id:
             # Get specific game
             try:
-                boxscore = boxscoretraditionalv2.BoxScoreTraditionalV2(game_id=game_id)
-                boxscore_df = boxscore.get_data_frames()[0]
+                boxscore_df = self._fetch_boxscore_df(game_id)
                 data["games"].append(
                     {
                         "game_id": game_id,
-                        "boxscore": boxscore_df.to_dict("records")
-                        if not boxscore_df.empty
-                        else [],
+                        "boxscore": self._records(
+                            boxscore_df, self.BOXSCORE_COLUMNS
+                        ),
                     }
                 )
             except Exception as e:
-                print(f"Error fetching game {game_id}: {e}")
+                self._record_error(data, f"Error fetching game {game_id}: {e}")
         else:
             # Find games by teams or players
             team_ids = [team["id"] for team in entities.get("teams", [])]
@@ -465,8 +1007,6 @@ class NBADataRetriever:
                 # For team "last game" questions, use LeagueGameFinder without season filter
                 # to get all games, then sort by date
                 if team_ids and is_last_game:
-                    import pandas as pd
-
                     # Get the team name from entities (the team asked about)
                     # Use the first team found (should be the most relevant)
                     team_entity = entities.get("teams", [])[0]
@@ -478,18 +1018,17 @@ class NBADataRetriever:
                         print(f"Warning: Invalid team entity: {team_entity}")
                         return data
 
-                    gamefinder = leaguegamefinder.LeagueGameFinder(
-                        team_id_nullable=team_id
-                    )
-                    games_df = gamefinder.get_data_frames()[0]
+                    games_df = self._fetch_games_df(team_id=team_id)
 
                     if not games_df.empty:
-                        # Sort by game date (descending) to get most recent
-                        games_df["GAME_DATE"] = pd.to_datetime(games_df["GAME_DATE"])
-                        games_df = games_df.sort_values("GAME_DATE", ascending=False)
-
-                        # Get most recent game
-                        last_game = games_df.iloc[0]
+                        # Get most recent game (single linear scan, no sort/copy);
+                        # LeagueGameFinder lists newest first if no date parsed
+                        game_dates = games_df["GAME_DATE"]
+                        if game_dates.notna().any():
+                            last_index = game_dates.idxmax()
+                        else:
+                            last_index = games_df.index[0]
+                        last_game = games_df.loc[last_index]
                         game_id = last_game["GAME_ID"]
                         matchup = last_game.get("MATCHUP", "")
 
@@ -507,71 +1046,69 @@ class NBADataRetriever:
                             # Get opponent (last part after "vs." or "@")
                             opp_abbrev = matchup_parts[-1]
                             # Try to find full team name from abbreviation
-                            opp_team = None
-                            for team in self.nba_teams:
-                                if team["abbreviation"] == opp_abbrev:
-                                    opp_team = team.get("full_name", opp_abbrev)
-                                    break
-                            opponent_name = opp_team if opp_team else opp_abbrev
+                            opp_team = self._team_by_abbrev.get(opp_abbrev.lower())
+                            opponent_name = (
+                                opp_team.get("full_name", opp_abbrev)
+                                if opp_team
+                                else opp_abbrev
+                            )
                         else:
                             opponent_name = "Opponent"
 
                         # Get boxscore for additional details
                         try:
-                            boxscore = boxscoretraditionalv2.BoxScoreTraditionalV2(
-                                game_id=game_id
+                            boxscore_df = self._fetch_boxscore_df(game_id)
+                        except Exception as e:
+                            self._record_error(
+                                data, f"Error fetching boxscore {game_id}: {e}"
                             )
-                            boxscore_df = boxscore.get_data_frames()[0]
-                        except Exception:
                             boxscore_df = pd.DataFrame()
 
                         data["games"].append(
                             {
                                 "game_id": game_id,
-                                "game_date": last_game["GAME_DATE"].strftime("%Y-%m-%d")
-                                if hasattr(last_game["GAME_DATE"], "strftime")
-                                else str(last_game.get("GAME_DATE", "")),
+                                "game_date": self._format_game_date(
+                                    last_game.get("GAME_DATE")
+                                ),
                                 "matchup": matchup,
                                 "team_name": team_name,  # Store the team asked about
                                 "opponent_name": opponent_name,
                                 "team_score": int(team_pts),
                                 "opponent_score": int(opp_pts),
                                 "result": last_game.get("WL", ""),
-                                "boxscore": boxscore_df.to_dict("records")
-                                if not boxscore_df.empty
-                                else [],
+                                "boxscore": self._records(
+                                    boxscore_df, self.BOXSCORE_COLUMNS
+                                ),
                             }
                         )
                 else:
                     # Default behavior: find games by teams or players
-                    gamefinder = leaguegamefinder.LeagueGameFinder(
-                        team_id_nullable=team_ids[0] if team_ids else None,
-                        player_id_nullable=player_ids[0] if player_ids else None,
-                        season_nullable=Season.default,
+                    games_df = self._fetch_games_df(
+                        team_id=team_ids[0] if team_ids else None,
+                        player_id=player_ids[0] if player_ids else None,
+                        season=Season.default,
                     )
-                    games_df = gamefinder.get_data_frames()[0]
 
                     # Get most recent game
                     if not games_df.empty:
                         recent_game = games_df.iloc[0]
                         game_id = recent_game["GAME_ID"]
-                        boxscore = boxscoretraditionalv2.BoxScoreTraditionalV2(
-                            game_id=game_id
-                        )
-                        boxscore_df = boxscore.get_data_frames()[0]
+                        boxscore_df = self._fetch_boxscore_df(game_id)
 
                         data["games"].append(
                             {
                                 "game_id": game_id,
-                                "game_date": recent_game.get("GAME_DATE", ""),
+                                "game_date": self._format_game_date(
+                                    recent_game.get("GAME_DATE")
+                                ),
                                 "matchup": recent_game.get("MATCHUP", ""),
-                                "boxscore": boxscore_df.to_dict("records")
-                                if not boxscore_df.empty
-                                else [],
+                                "boxscore": self._records(
+                                    boxscore_df, self.BOXSCORE_COLUMNS
+                                ),
                             }
                         )
             except Exception as e:
-                print(f"Error finding games: {e}")
+                self._record_error(data, f"Error finding games: {e}")
 
         return data
 
@@ -579,24 +1116,31 @@ class NBADataRetriever:
         """Get data for comparison questions"""
         data = {"type": "comparison", "players": []}
 
-        # Get stats for each player
-        for player in entities.get("players", []):
+        # Get stats for each player (requests run concurrently)
+        with ThreadPoolExecutor(max_workers=self.MAX_API_WORKERS) as executor:
+            pending = [
+                (player, executor.submit(self._fetch_career_df, player["id"]))
+                for player in entities.get("players", [])
+            ]
+
+        for player, career_future in pending:
             player_id = player["id"]
             try:
-                career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
-                career_df = career_stats.get_data_frames()[0]
+                career_df = career_future.result()
 
                 data["players"].append(
                     {
                         "player_id": player_id,
                         "player_name": player["full_name"],
-                        "career_stats": career_df.to_dict("records")
-                        if not career_df.empty
-                        else [],
+                        # Kept as a DataFrame so totals are one vectorized sum
+                        "career_df": career_df,
                     }
                 )
             except Exception as e:
-                print(f"Error fetching comparison data for {player['full_name']}: {e}")
+                self._record_error(
+                    data,
+                    f"Error fetching comparison data for {player['full_name']}: {e}",
+                )
 
         return data
 
@@ -610,23 +1154,23 @@ class NBADataRetriever:
             player_ids = [player["id"] for player in entities.get("players", [])]
             if player_ids:
                 try:
-                    gamefinder = leaguegamefinder.LeagueGameFinder(
-                        player_id_nullable=player_ids[0], season_nullable=Season.default
+                    games_df = self._fetch_games_df(
+                        player_id=player_ids[0], season=Season.default
                     )
-                    games_df = gamefinder.get_data_frames()[0]
                     if not games_df.empty:
                         game_id = games_df.iloc[0]["GAME_ID"]
                 except Exception as e:
-                    print(f"Error finding game for play-by-play: {e}")
+                    self._record_error(
+                        data, f"Error finding game for play-by-play: {e}"
+                    )
 
         if game_id:
             try:
-                pbp = playbyplay.PlayByPlay(game_id=game_id)
-                pbp_df = pbp.get_data_frames()[0]
-                data["plays"] = pbp_df.to_dict("records") if not pbp_df.empty else []
+                pbp_df = self._fetch_play_by_play_df(game_id)
+                data["plays"] = self._records(pbp_df, self.PBP_COLUMNS)
                 data["game_id"] = game_id
             except Exception as e:
-                print(f"Error fetching play-by-play: {e}")
+                self._record_error(data, f"Error fetching play-by-play: {e}")
 
         return data
 
@@ -647,24 +1191,23 @@ class NBADataRetriever:
 
         try:
             # Request all-time leaders
-            leaders = leagueleaders.LeagueLeaders(
-                league_id="00",
-                season="All Time",
-                season_type_all_star="Regular Season",
-                stat_category_abbreviation=stat_abbrev,
-                per_mode48="Totals",
-            )
-            df = leaders.get_data_frames()[0]
+            df = self._fetch_league_leaders_df(stat_abbrev, "All Time")
 
             if not df.empty:
                 # Get top N players
                 top_players = df.head(top_n)
 
-                for idx, (_, row) in enumerate(top_players.iterrows(), start=1):
+                # Lightweight namedtuples instead of a boxed Series per row
+                rank_col = f"{stat_abbrev}_RANK"
+                for idx, row in enumerate(top_players.itertuples(index=False), start=1):
                     # Try to get rank from stat-specific column (e.g., AST_RANK) or generic RANK
-                    rank = row.get(f"{stat_abbrev}_RANK") or row.get("RANK") or idx
-                    player_name = row.get("PLAYER_NAME", "Unknown")
-                    stat_value = row.get(stat_abbrev, 0)
+                    rank = (
+                        getattr(row, rank_col, None)
+                        or getattr(row, "RANK", None)
+                        or idx
+                    )
+                    player_name = getattr(row, "PLAYER_NAME", "Unknown")
+                    stat_value = getattr(row, stat_abbrev, 0)
 
                     data["leaders"].append(
                         {
@@ -676,7 +1219,7 @@ class NBADataRetriever:
                         }
                     )
         except Exception as e:
-            print(f"Error fetching league leaders: {e}")
+            self._record_error(data, f"Error fetching league leaders: {e}")
 
         return data
 
@@ -688,26 +1231,92 @@ class NBADataRetriever:
         return {"type": "general", "data": {}}
 
 
+# Per-season columns summed into career totals
+CAREER_TOTAL_COLUMNS = ["PTS", "REB", "AST", "TOV", "BLK", "GP"]
+
+
+# Display names for league leader stat types
+_STAT_NAMES = {
+    "points": "points",
+    "rebounds": "rebounds",
+    "assists": "assists",
+    "steals": "steals",
+    "blocks": "blocks",
+    "turnovers": "turnovers",
+    "three_pointers": "three-pointers",
+}
+
+# League leader stats shown as decimals rather than integer totals
+_PCT_STATS = frozenset({"FG_PCT", "FG3_PCT", "FT_PCT"})
+
+# Play-by-play EVENTMSGTYPE values for made (1) and missed (2) shots
+_SHOT_EVENTS = frozenset({1, 2})
+
+
+def _leader_value_formatter(stat_abbrev: str) -> Callable[[Any], str]:
+    """Stat value formatter: decimal for percentages, integer for totals"""
+    if stat_abbrev in _PCT_STATS:
+        return "{:.3f}".format
+    return lambda stat_value: f"{int(stat_value):,}"
+
+
 class ContextGenerator:
     """Converts structured NBA API data to natural language context"""
 
+    @staticmethod
+    def _player_source(
+        source_type: str, player_id: Any, player_name: str
+    ) -> Dict[str, str]:
+        """Source citation for a per-player endpoint"""
+        return {
+            "type": source_type,
+            "player_id": str(player_id),
+            "player_name": player_name,
+        }
+
+    @staticmethod
+    def _career_totals(career_df: pd.DataFrame) -> Tuple[float, ...]:
+        """
+        Career sums of CAREER_TOTAL_COLUMNS, in that order: one reduction over
+        a contiguous (seasons, 6) float64 block; NaN (untracked early stats)
+        counts as 0
+        """
+        return tuple(
+            np.nansum(
+                np.column_stack(
+                    [
+                        career_df[col].to_numpy(dtype=np.float64)
+                        for col in CAREER_TOTAL_COLUMNS
+                    ]
+                ),
+                axis=0,
+            )
+        )
+
     def generate(
-        self, data: Dict[str, Any], question: str
+        self, data: Dict[str, Any], question: str, question_lower: Optional[str] = None
     ) -> Tuple[str, List[Dict[str, str]]]:
-        """Generate natural language context from API data"""
+        """
+        Generate natural language context from API data. Pass question_lower
+        (e.g. QuestionAnalysis.question_lower) to skip lowercasing it again.
+        """
+        if question_lower is None:
+            question_lower = question.lower()
         data_type = data.get("type", "general")
         sources = []
 
         if data_type == "player_stats":
-            context, sources = self._generate_player_stats_context(data, question)
+            context, sources = self._generate_player_stats_context(data, question_lower)
         elif data_type == "game_data":
-            context, sources = self._generate_game_context(data, question)
+            context, sources = self._generate_game_context(data, question_lower)
         elif data_type == "comparison":
-            context, sources = self._generate_comparison_context(data, question)
+            context, sources = self._generate_comparison_context(data, question_lower)
         elif data_type == "play_by_play":
-            context, sources = self._generate_play_by_play_context(data, question)
+            context, sources = self._generate_play_by_play_context(data, question_lower)
         elif data_type == "league_leaders":
-            context, sources = self._generate_league_leaders_context(data, question)
+            context, sources = self._generate_league_leaders_context(
+                data, question_lower
+            )
         else:
             context = "No specific NBA data found to answer this question."
             sources = []
@@ -715,10 +1324,10 @@ class ContextGenerator:
         return context, sources
 
     def _generate_player_stats_context(
-        self, data: Dict, question: str
+        self, data: Dict, question_lower: str
     ) -> Tuple[str, List[Dict]]:
         """Generate context for player statistics"""
-        context_parts = []
+        player_contexts = []
         sources = []
 
         for player_data in data.get("players", []):
@@ -726,18 +1335,16 @@ class ContextGenerator:
             player_id = player_data["player_id"]
 
             # Career stats summary
-            career_stats = player_data.get("career_stats", [])
-            if career_stats:
+            career_text = ""
+            career_df = player_data.get("career_df")
+            if career_df is not None and not career_df.empty:
                 # Calculate career totals and averages (matching training data format)
-                total_seasons = len(career_stats)
+                total_seasons = len(career_df)
 
                 # Sum totals across all seasons
-                total_pts = sum(season.get("PTS", 0) for season in career_stats)
-                total_reb = sum(season.get("REB", 0) for season in career_stats)
-                total_ast = sum(season.get("AST", 0) for season in career_stats)
-                total_tov = sum(season.get("TOV", 0) for season in career_stats)
-                total_blk = sum(season.get("BLK", 0) for season in career_stats)
-                total_gp = sum(season.get("GP", 0) for season in career_stats)
+                total_pts, total_reb, total_ast, total_tov, total_blk, total_gp = (
+                    self._career_totals(career_df)
+                )
 
                 # Calculate career averages
                 if total_gp > 0:
@@ -750,7 +1357,7 @@ class ContextGenerator:
                     career_ppg = career_rpg = career_apg = career_tov = career_bpg = 0.0
 
                 # Get most recent season for additional context
-                latest_season = career_stats[0]  # Most recent season
+                latest_season = career_df.iloc[0]  # Most recent season
                 season_id = latest_season.get("SEASON_ID", "N/A")
                 season_gp = latest_season.get("GP", 0)
 
@@ -772,7 +1379,7 @@ class ContextGenerator:
                     ) = 0.0
 
                 # Generate context matching training data format
-                context_parts.append(
+                career_text = (
                     f"{player_name} has played {total_seasons} seasons in the NBA. "
                     f"Over his career, he has averaged {career_ppg:.1f} points per game, "
                     f"{career_rpg:.1f} rebounds per game, {career_apg:.1f} assists per game, "
@@ -784,39 +1391,33 @@ class ContextGenerator:
                     f"and {season_bpg:.1f} blocks per game."
                 )
                 sources.append(
-                    {
-                        "type": "player_career_stats",
-                        "player_id": str(player_id),
-                        "player_name": player_name,
-                    }
+                    self._player_source("player_career_stats", player_id, player_name)
                 )
 
             # Recent games
+            recent_text = ""
             recent_games = player_data.get("recent_games", [])
             if recent_games:
-                context_parts.append(f"\n{player_name}'s most recent games:")
-                for game in recent_games[:3]:  # Last 3 games
-                    game_date = game.get("GAME_DATE", "N/A")
-                    matchup = game.get("MATCHUP", "N/A")
-                    pts = game.get("PTS", 0)
-                    reb = game.get("REB", 0)
-                    ast = game.get("AST", 0)
-                    context_parts.append(
-                        f"On {game_date} against {matchup}, {player_name} scored {pts} points, "
-                        f"{reb} rebounds, and {ast} assists."
-                    )
+                game_lines = " ".join(
+                    f"On {game.get('GAME_DATE', 'N/A')} against {game.get('MATCHUP', 'N/A')}, "
+                    f"{player_name} scored {game.get('PTS', 0)} points, "
+                    f"{game.get('REB', 0)} rebounds, and {game.get('AST', 0)} assists."
+                    for game in recent_games[:3]  # Last 3 games
+                )
+                recent_text = f"\n{player_name}'s most recent games: {game_lines}"
                 sources.append(
-                    {
-                        "type": "player_game_log",
-                        "player_id": str(player_id),
-                        "player_name": player_name,
-                    }
+                    self._player_source("player_game_log", player_id, player_name)
                 )
 
-        return " ".join(context_parts), sources
+            if career_text and recent_text:
+                player_contexts.append(f"{career_text} {recent_text}")
+            elif career_text or recent_text:
+                player_contexts.append(career_text or recent_text)
+
+        return " ".join(player_contexts), sources
 
     def _generate_game_context(
-        self, data: Dict, question: str
+        self, data: Dict, question_lower: str
     ) -> Tuple[str, List[Dict]]:
         """Generate context for game data"""
         context_parts = []
@@ -868,20 +1469,19 @@ class ContextGenerator:
                 if boxscore:
                     context_parts.append(f"Game {game_id} on {game_date}: {matchup}")
 
-                    # Group by team
-                    teams_data = {}
+                    # Group by team in one pass: [total points, first 3 names]
+                    teams_data = defaultdict(lambda: [0, []])
                     for player in boxscore:
-                        team = player.get("TEAM_ABBREVIATION", "UNK")
-                        if team not in teams_data:
-                            teams_data[team] = {"players": [], "total_pts": 0}
-                        teams_data[team]["players"].append(player)
-                        teams_data[team]["total_pts"] += player.get("PTS", 0)
-
-                    for team, team_info in teams_data.items():
-                        context_parts.append(
-                            f"{team} scored {team_info['total_pts']} points. "
-                            f"Top performers: {', '.join([p.get('PLAYER_NAME', '') for p in team_info['players'][:3]])}"
-                        )
+                        entry = teams_data[player.get("TEAM_ABBREVIATION", "UNK")]
+                        entry[0] += player.get("PTS", 0)
+                        if len(entry[1]) < 3:
+                            entry[1].append(player.get("PLAYER_NAME", ""))
+
+                    context_parts.extend(
+                        f"{team} scored {total_pts} points. "
+                        f"Top performers: {', '.join(top_names)}"
+                        for team, (total_pts, top_names) in teams_data.items()
+                    )
 
                     sources.append(
                         {"type": "boxscore", "game_id": game_id, "game_date": game_date}
@@ -890,7 +1490,7 @@ class ContextGenerator:
         return " ".join(context_parts), sources
 
     def _generate_comparison_context(
-        self, data: Dict, question: str
+        self, data: Dict, question_lower: str
     ) -> Tuple[str, List[Dict]]:
         """Generate context for player comparisons"""
         context_parts = []
@@ -900,16 +1500,13 @@ class ContextGenerator:
         for player_data in data.get("players", []):
             player_name = player_data["player_name"]
             player_id = player_data["player_id"]
-            career_stats = player_data.get("career_stats", [])
+            career_df = player_data.get("career_df")
 
-            if career_stats:
+            if career_df is not None and not career_df.empty:
                 # Calculate career averages for comparison
-                total_pts = sum(season.get("PTS", 0) for season in career_stats)
-                total_reb = sum(season.get("REB", 0) for season in career_stats)
-                total_ast = sum(season.get("AST", 0) for season in career_stats)
-                total_tov = sum(season.get("TOV", 0) for season in career_stats)
-                total_blk = sum(season.get("BLK", 0) for season in career_stats)
-                total_gp = sum(season.get("GP", 0) for season in career_stats)
+                total_pts, total_reb, total_ast, total_tov, total_blk, total_gp = (
+                    self._career_totals(career_df)
+                )
 
                 if total_gp > 0:
                     career_ppg = total_pts / total_gp
@@ -939,17 +1536,13 @@ class ContextGenerator:
                 )
 
                 sources.append(
-                    {
-                        "type": "player_career_stats",
-                        "player_id": str(player_id),
-                        "player_name": player_name,
-                    }
+                    self._player_source("player_career_stats", player_id, player_name)
                 )
 
         return " ".join(context_parts), sources
 
     def _generate_play_by_play_context(
-        self, data: Dict, question: str
+        self, data: Dict, question_lower: str
     ) -> Tuple[str, List[Dict]]:
         """Generate context for play-by-play data"""
         context_parts = []
@@ -962,33 +1555,40 @@ class ContextGenerator:
             context_parts.append(f"Play-by-play for game {game_id}:")
 
             # Filter relevant plays based on question
-            if "shot" in question.lower():
-                shot_plays = [
-                    p for p in plays if p.get("EVENTMSGTYPE") in [1, 2]
-                ]  # Made/missed shots
-                for play in shot_plays[:10]:  # First 10 shots
-                    player = play.get("PLAYER1_NAME", "Unknown")
-                    action = play.get("HOMEDESCRIPTION") or play.get(
-                        "VISITORDESCRIPTION", ""
+            if "shot" in question_lower:
+                # Made/missed shots; stops scanning once 10 have been seen
+                shot_plays = (p for p in plays if p.get("EVENTMSGTYPE") in _SHOT_EVENTS)
+                actions = (
+                    (
+                        play.get("PLAYER1_NAME", "Unknown"),
+                        play.get("HOMEDESCRIPTION") or play.get("VISITORDESCRIPTION"),
                     )
-                    if action:
-                        context_parts.append(f"{player}: {action}")
+                    for play in islice(shot_plays, 10)  # First 10 shots
+                )
+                context_parts.extend(
+                    f"{player}: {action}" for player, action in actions if action
+                )
             else:
                 # General play-by-play
-                for play in plays[:20]:  # First 20 plays
-                    player = play.get("PLAYER1_NAME", "")
-                    action = play.get("HOMEDESCRIPTION") or play.get(
-                        "VISITORDESCRIPTION", ""
+                actions = (
+                    (
+                        play.get("PLAYER1_NAME", ""),
+                        play.get("HOMEDESCRIPTION") or play.get("VISITORDESCRIPTION"),
                     )
-                    if action and player:
-                        context_parts.append(f"{player}: {action}")
+                    for play in plays[:20]  # First 20 plays
+                )
+                context_parts.extend(
+                    f"{player}: {action}"
+                    for player, action in actions
+                    if action and player
+                )
 
             sources.append({"type": "play_by_play", "game_id": game_id})
 
         return " ".join(context_parts), sources
 
     def _generate_league_leaders_context(
-        self, data: Dict, question: str
+        self, data: Dict, question_lower: str
     ) -> Tuple[str, List[Dict]]:
         """Generate context for league leaders"""
         context_parts = []
@@ -1003,35 +1603,19 @@ class ContextGenerator:
         stat_abbrev = leaders[0].get("stat_abbrev", "PTS")
 
         # Format stat name for display
-        stat_names = {
-            "points": "points",
-            "rebounds": "rebounds",
-            "assists": "assists",
-            "steals": "steals",
-            "blocks": "blocks",
-            "turnovers": "turnovers",
-            "three_pointers": "three-pointers",
-        }
-        stat_display = stat_names.get(stat_type, "statistics")
+        stat_display = _STAT_NAMES.get(stat_type, "statistics")
 
         context_parts.append(
             f"The top {len(leaders)} players with the most {stat_display} in NBA history are:"
         )
 
-        for leader in leaders:
-            rank = leader.get("rank", 0)
-            player_name = leader.get("player_name", "Unknown")
-            stat_value = leader.get("stat_value", 0)
-
-            # Format stat value (integer for totals, decimal for percentages)
-            if stat_abbrev in ["FG_PCT", "FG3_PCT", "FT_PCT"]:
-                stat_display_value = f"{stat_value:.3f}"
-            else:
-                stat_display_value = f"{int(stat_value):,}"
-
-            context_parts.append(
-                f"{rank}. {player_name} with {stat_display_value} {stat_display}."
-            )
+        # Format stat value (integer for totals, decimal for percentages)
+        format_value = _leader_value_formatter(stat_abbrev)
+        context_parts.extend(
+            f"{leader['rank']}. {leader['player_name']} with "
+            f"{format_value(leader['stat_value'])} {stat_display}."
+            for leader in leaders
+        )
 
         sources.append(
             {
@@ -1047,13 +1631,198 @@ class ContextGenerator:
 class NBAQASystem:
     """Main QA system integrating NBA API with Hugging Face QA model"""
 
-    def __init__(self, model_name: str = "deepset/roberta-base-squad2"):
-        """Initialize the QA system"""
-        self.qa_pipeline = pipeline("question-answering", model=model_name)
+    # Confidence of answers produced when data or the QA model is unavailable
+    NO_DATA_CONFIDENCE = 0.0
+    FALLBACK_CONFIDENCE = 0.5
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_QA_MODEL,
+        backend: str = "auto",
+        device: Optional[int] = None,
+        num_threads: Optional[int] = None,
+    ):
+        """
+        Initialize the QA system
+
+        Args:
+            model_name: Hugging Face extractive QA model. Defaults to the
+                distilled DistilBERT SQuAD model (~2x faster encoder on CPU).
+                Alternatives: "deepset/minilm-uncased-squad2" (smaller MiniLM),
+                "deepset/roberta-base-squad2" (base of the fine-tuned model,
+                slower but more accurate)
+            backend: "torch" (FP32 on CPU, FP16 on GPU), "onnx-int8" (ONNX
+                Runtime, dynamic INT8 quantization on CPU; needs
+                optimum[onnxruntime]) or "auto" (torch on GPU, else INT8 when
+                optimum[onnxruntime] is installed, otherwise torch)
+            device: CUDA device index for the torch backend, -1 for CPU.
+                Defaults to the first GPU when one is available
+            num_threads: Cap torch's CPU inference threads. This applies to the
+                whole process, so it is off by default (torch picks the count)
+        """
+        if backend != "auto" and backend not in QA_BACKENDS:
+            raise ValueError(
+                f"Unknown QA backend {backend!r}, expected one of {QA_BACKENDS}"
+            )
+        # The model is loaded on first use (see qa_pipeline)
+        self._model_name = model_name
+        self._backend = backend
+        self._device = device
+        self._num_threads = num_threads
+        self._qa_pipeline = None
         self.analyzer = QuestionAnalyzer()
         self.retriever = NBADataRetriever()
         self.context_generator = ContextGenerator()
 
+        # Whole answers for repeated questions, keyed on (question, day) so
+        # "last game" style answers are recomputed at least daily
+        self._answer_cache = LRUCache(maxsize=256)
+        self._answer_cache_lock = threading.Lock()  # LRUCache is not thread-safe
+
+        # Question types answered from structured data; each handler returns
+        # (answer, confidence), or None to fall back to the QA model
+        self._direct_handlers = {
+            "league_leaders": self._league_leaders_answer,
+            "game_result": self._last_game_answer,
+        }
+
+    @property
+    def qa_pipeline(self):
+        """Hugging Face QA pipeline, loaded on first access"""
+        if self._qa_pipeline is None:
+            device = self._device if self._device is not None else _cuda_device()
+            self._qa_pipeline = _get_qa_pipeline(
+                self._model_name,
+                device=device,
+                backend=_resolve_qa_backend(self._backend, device),
+                num_threads=self._num_threads,
+            )
+        return self._qa_pipeline
+
+    def cache_clear(self) -> None:
+        """Drop cached answers and question analyses"""
+        with self._answer_cache_lock:
+            self._answer_cache.clear()
+        self.analyzer.cache_clear()
+
+    def _run_qa_model(self, question: str, context: str) -> Dict[str, Any]:
+        """
+        Extract an answer span from context. Contexts longer than the model's
+        max length are split into overlapping windows by the pipeline; those
+        windows go through the model in batches rather than one at a time,
+        and the highest-scoring span across windows is returned.
+        """
+        return self.qa_pipeline(
+            question=question, context=context, batch_size=QA_BATCH_SIZE
+        )
+
+    def _run_qa_model_batch(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run the QA model over (question, context) pairs in one pipeline call
+        so windows from all questions share forward passes. A None result
+        means the model failed for that question.
+        """
+        if not pairs:
+            return []
+
+        # Loaded outside the try blocks: a bad model name/path, missing
+        # package or failed ONNX export must raise, not be reported (and
+        # retried) as a per-question inference failure
+        qa_pipeline = self.qa_pipeline
+
+        if len(pairs) == 1:
+            question, context = pairs[0]
+            try:
+                return [self._run_qa_model(question, context)]
+            except Exception as e:
+                print(f"Error in QA model: {e}")
+                return [None]
+
+        try:
+            return list(
+                qa_pipeline(
+                    [
+                        {"question": question, "context": context}
+                        for question, context in pairs
+                    ],
+                    batch_size=QA_BATCH_SIZE,
+                )
+            )
+        except Exception as e:
+            # Retry one by one so a single bad input doesn't sink the batch
+            print(f"Error in batched QA model, retrying per question: {e}")
+            return [self._run_qa_model_batch([pair])[0] for pair in pairs]
+
+    def _league_leaders_answer(
+        self, analysis: QuestionAnalysis, nba_data: Dict[str, Any]
+    ) -> Optional[Tuple[str, float]]:
+        """
+        "Top N" league leader questions: these need to return a full list,
+        not a single extracted answer
+        """
+        if (
+            analysis.entities.get("top_n") is None
+            or nba_data.get("type") != "league_leaders"
+        ):
+            return None
+
+        leaders = nba_data.get("leaders", [])
+        if not leaders:
+            return "No league leaders data found.", self.NO_DATA_CONFIDENCE
+
+        # Get stat abbreviation for column header
+        stat_abbrev = leaders[0].get("stat_abbrev", "STAT")
+
+        # Format as a table-like list: header, divider, one row per leader
+        format_value = _leader_value_formatter(stat_abbrev)
+        answer_lines = [
+            f"{'Rank':<6} {'Player Name':<20} {stat_abbrev}",
+            "-" * 50,
+        ] + [
+            f"{leader['rank']:<6} {leader['player_name']:<20} "
+            f"{format_value(leader['stat_value'])}"
+            for leader in leaders
+        ]
+
+        # High confidence for structured data
+        return "\n".join(answer_lines), 0.95
+
+    def _last_game_answer(
+        self, analysis: QuestionAnalysis, nba_data: Dict[str, Any]
+    ) -> Optional[Tuple[str, float]]:
+        """Answer "last game" questions by formatting the known score directly"""
+        if (
+            not analysis.entities.get("temporal", {}).get("last", False)
+            or nba_data.get("type") != "game_data"
+        ):
+            return None
+
+        games = nba_data.get("games", [])
+        if not games:
+            return None
+
+        game = games[0]
+        team_score = game.get("team_score")
+        opponent_score = game.get("opponent_score")
+        if team_score is None or opponent_score is None:
+            return None
+
+        team_name = game.get("team_name", "")
+        opponent_name = game.get("opponent_name", "")
+        result = game.get("result", "")
+
+        # Format: "Lakers 120, Warriors 115" or "Lakers won 120-115"
+        question_lower = analysis.question_lower
+        if question_lower is None:
+            question_lower = analysis.question.lower()
+        if "score" in question_lower:
+            answer = f"{team_name} {team_score}, {opponent_name} {opponent_score}"
+        else:
+            answer = f"{team_name} {'won' if result == 'W' else 'lost'} {team_score}-{opponent_score}"
+        return answer, 0.95
+
     def answer(self, question: str) -> QAAnswer:
         """
         Main method to answer a question about NBA
@@ -1064,6 +1833,69 @@ class NBAQASystem:
         Returns:
             QAAnswer object with answer, confidence, context, and sources
         """
+        key = (question, date.today())
+        with self._answer_cache_lock:
+            cached = self._answer_cache.get(key)
+        if cached is not None:
+            return self._copy_answer(cached)
+
+        answer, cacheable = self._answer_many([question])[0]
+        self._cache_answer(key, answer, cacheable)
+        return self._copy_answer(answer)
+
+    @staticmethod
+    def _copy_answer(answer: QAAnswer) -> QAAnswer:
+        """Copy of answer with its own sources and raw_data (cache hits share one)"""
+        return replace(
+            answer,
+            sources=tuple(dict(source) for source in answer.sources),
+            raw_data=copy.deepcopy(answer.raw_data),
+        )
+
+    def _cache_answer(
+        self, key: Tuple[str, date], answer: QAAnswer, cacheable: bool
+    ) -> None:
+        """
+        Cache answer only if it was built from complete data and a working QA
+        model; after an NBA API or model error the next call retries instead
+        of serving the failure for the rest of the day
+        """
+        if not cacheable:
+            return
+        with self._answer_cache_lock:
+            self._answer_cache[key] = answer
+
+    def answer_batch(self, questions: List[str]) -> List[QAAnswer]:
+        """
+        Answer several questions, sending all of them that need the QA model
+        through it in a single batched call
+
+        Args:
+            questions: Natural language questions about NBA
+
+        Returns:
+            One QAAnswer per question, in the same order
+        """
+        today = date.today()
+        answers = {}
+        with self._answer_cache_lock:
+            for question in questions:
+                cached = self._answer_cache.get((question, today))
+                if cached is not None:
+                    answers[question] = cached
+
+        # Only cache misses go through the pipeline (each once)
+        misses = [q for q in dict.fromkeys(questions) if q not in answers]
+        for question, (answer, cacheable) in zip(misses, self._answer_many(misses)):
+            self._cache_answer((question, today), answer, cacheable)
+            answers[question] = answer
+
+        return [self._copy_answer(answers[question]) for question in questions]
+
+    def _prepare(
+        self, question: str
+    ) -> Tuple[QuestionAnalysis, Dict[str, Any], str, List[Dict]]:
+        """Steps shared by every entrypoint: analysis, retrieval, context"""
         # Step 1: Analyze question
         analysis = self.analyzer.analyze(question)
 
@@ -1071,133 +1903,102 @@ class NBAQASystem:
         nba_data = self.retriever.retrieve(analysis)
 
         # Step 3: Generate context
-        context, sources = self.context_generator.generate(nba_data, question)
+        context, sources = self.context_generator.generate(
+            nba_data, question, analysis.question_lower
+        )
 
-        if (
-            not context
-            or context == "No specific NBA data found to answer this question."
-        ):
-            return QAAnswer(
-                answer="I couldn't find relevant NBA data to answer this question. Please try asking about specific players, teams, or games.",
-                confidence=0.0,
-                context_used="",
-                sources=[],
-                raw_data=nba_data,
+        return analysis, nba_data, context, sources
+
+    def _run(
+        self, question: str
+    ) -> Tuple[
+        QuestionAnalysis, Dict[str, Any], str, List[Dict], Optional[Dict[str, Any]]
+    ]:
+        """_prepare plus the QA model over the context (None if it failed)"""
+        analysis, nba_data, context, sources = self._prepare(question)
+        qa_result = (
+            self._run_qa_model_batch([(question, context)])[0] if context else None
+        )
+        return analysis, nba_data, context, sources, qa_result
+
+    def _answer_many(self, questions: List[str]) -> List[Tuple[QAAnswer, bool]]:
+        """
+        Answer questions in order, batching the QA model step. Each answer
+        comes with whether it is safe to cache (no fetch or model errors)
+        """
+        answers: List[Optional[QAAnswer]] = []
+        cacheable: List[bool] = []
+        needs_model = []  # (index, question, context, sources, nba_data)
+
+        for question in questions:
+            analysis, nba_data, context, sources = self._prepare(question)
+            # Retrieval failures leave the data missing or partial
+            cacheable.append(not nba_data.get("errors"))
+
+            if (
+                not context
+                or context == "No specific NBA data found to answer this question."
+            ):
+                answers.append(
+                    QAAnswer(
+                        answer="I couldn't find relevant NBA data to answer this question. Please try asking about specific players, teams, or games.",
+                        confidence=self.NO_DATA_CONFIDENCE,
+                        context_used="",
+                        sources=(),
+                        raw_data=nba_data,
+                    )
+                )
+                continue
+
+            # Step 4: Structured answers that don't need the QA model
+            handler = self._direct_handlers.get(analysis.question_type)
+            direct = handler(analysis, nba_data) if handler else None
+            if direct is None:
+                needs_model.append((len(answers), question, context, sources, nba_data))
+                answers.append(None)
+                continue
+
+            answer, confidence = direct
+            answers.append(
+                QAAnswer(
+                    answer=answer,
+                    confidence=confidence,
+                    context_used=context,
+                    sources=tuple(sources),
+                    raw_data=nba_data,
+                )
             )
 
-        # Step 4: Special handling for "top N" league leader questions
-        # These need to return a full list, not a single extracted answer
-        if (
-            analysis.question_type == "league_leaders"
-            and analysis.entities.get("top_n") is not None
-            and nba_data.get("type") == "league_leaders"
-        ):
-            leaders = nba_data.get("leaders", [])
-            if leaders:
-                # Get stat abbreviation for column header
-                stat_abbrev = leaders[0].get("stat_abbrev", "STAT")
-
-                # Format as a table-like list
-                answer_lines = []
-                # Header
-                answer_lines.append(f"{'Rank':<6} {'Player Name':<20} {stat_abbrev}")
-                answer_lines.append("-" * 50)
-
-                for leader in leaders:
-                    rank = leader.get("rank", 0)
-                    player_name = leader.get("player_name", "Unknown")
-                    stat_value = leader.get("stat_value", 0)
-
-                    # Format stat value
-                    if stat_abbrev in ["FG_PCT", "FG3_PCT", "FT_PCT"]:
-                        stat_display = f"{stat_value:.3f}"
-                    else:
-                        stat_display = f"{int(stat_value):,}"
-
-                    answer_lines.append(f"{rank:<6} {player_name:<20} {stat_display}")
-
-                answer = "\n".join(answer_lines)
-                confidence = 0.95  # High confidence for structured data
-            else:
-                answer = "No league leaders data found."
-                confidence = 0.0
-        # Special handling for "last game" questions - format score directly
-        elif (
-            analysis.question_type == "game_result"
-            and analysis.entities.get("temporal", {}).get("last", False)
-            and nba_data.get("type") == "game_data"
+        # Step 5: Use QA model for single-answer questions, all in one batch
+        qa_results = self._run_qa_model_batch(
+            [(question, context) for _, question, context, _, _ in needs_model]
+        )
+        for (index, _, context, sources, nba_data), qa_result in zip(
+            needs_model, qa_results
         ):
-            games = nba_data.get("games", [])
-            if games and len(games) > 0:
-                game = games[0]
-                team_score = game.get("team_score")
-                opponent_score = game.get("opponent_score")
-                team_name = game.get("team_name", "")
-                opponent_name = game.get("opponent_name", "")
-                result = game.get("result", "")
-
-                if team_score is not None and opponent_score is not None:
-                    # Format: "Lakers 120, Warriors 115" or "Lakers won 120-115"
-                    if "score" in question.lower():
-                        answer = f"{team_name} {team_score}, {opponent_name} {opponent_score}"
-                    else:
-                        answer = f"{team_name} {'won' if result == 'W' else 'lost'} {team_score}-{opponent_score}"
-                    confidence = 0.95
-                else:
-                    # Fallback to QA model
-                    try:
-                        qa_result = self.qa_pipeline(question=question, context=context)
-                        answer = qa_result["answer"]
-                        confidence = qa_result["score"]
-                    except Exception as e:
-                        print(f"Error in QA model: {e}")
-                        answer = (
-                            context[:200] + "..." if len(context) > 200 else context
-                        )
-                        confidence = 0.5
-            else:
-                # Fallback to QA model
-                try:
-                    qa_result = self.qa_pipeline(question=question, context=context)
-                    answer = qa_result["answer"]
-                    confidence = qa_result["score"]
-                except Exception as e:
-                    print(f"Error in QA model: {e}")
-                    answer = context[:200] + "..." if len(context) > 200 else context
-                    confidence = 0.5
-        else:
-            # Step 5: Use QA model for single-answer questions
-            try:
-                qa_result = self.qa_pipeline(question=question, context=context)
+            if qa_result is not None:
                 answer = qa_result["answer"]
                 confidence = qa_result["score"]
-            except Exception as e:
-                print(f"Error in QA model: {e}")
+            else:
                 # Fallback: return context if QA fails
                 answer = context[:200] + "..." if len(context) > 200 else context
-                confidence = 0.5
+                confidence = self.FALLBACK_CONFIDENCE
+                cacheable[index] = False
+
+            # Format answer
+            answers[index] = QAAnswer(
+                answer=answer,
+                confidence=confidence,
+                context_used=context,
+                sources=tuple(sources),
+                raw_data=nba_data,
+            )
 
-        # Step 5: Format answer
-        return QAAnswer(
-            answer=answer,
-            confidence=confidence,
-            context_used=context,
-            sources=sources,
-            raw_data=nba_data,
-        )
+        return list(zip(answers, cacheable))
 
     def answer_with_details(self, question: str) -> Dict[str, Any]:
         """Answer question with full details for debugging"""
-        analysis = self.analyzer.analyze(question)
-        nba_data = self.retriever.retrieve(analysis)
-        context, sources = self.context_generator.generate(nba_data, question)
-
-        qa_result = None
-        if context:
-            try:
-                qa_result = self.qa_pipeline(question=question, context=context)
-            except Exception as e:
-                print(f"Error in QA model: {e}")
+        analysis, nba_data, context, sources, qa_result = self._run(question)
 
         return {
             "question": question,
@@ -1234,12 +2035,13 @@ if __name__ == "__main__":
     print("NBA Question Answering System - Example Queries\n")
     print("=" * 60)
 
-    for question in example_questions:
+    # One batched QA model call for all questions that need it
+    answers = qa_system.answer_batch(example_questions)
+
+    for question, answer in zip(example_questions, answers):
         print(f"\nQuestion: {question}")
         print("-" * 60)
 
-        answer = qa_system.answer(question)
-
         print(f"Answer: {answer.answer}")
         print(f"Confidence: {answer.confidence:.2f}")
         print(f"Sources: {len(answer.sources)} source(s)")